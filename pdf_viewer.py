@@ -1,14 +1,19 @@
+import functools
+import logging
 import os
 import sys
 from pathlib import Path
-import json
 
 
 from PyQt6.QtCore import (
+    QSettings,
     QSortFilterProxyModel,
     Qt,
+    QObject,
     QPointF,
-    QStandardPaths,
+    QRunnable,
+    QThreadPool,
+    QTimer,
     pyqtSignal,
     qInstallMessageHandler,
     QtMsgType,
@@ -33,16 +38,28 @@ from PyQt6.QtPdfWidgets import QPdfView
 
 
 # ---------- Suppress specific Qt warnings ----------
-def qt_message_filter(msg_type, context, message):
-    """Suppress noisy invalid-bookmark warnings but keep all others."""
-    if (
-        msg_type == QtMsgType.QtWarningMsg
-        and "bookmark with invalid location" in message
-    ):
-        return  # swallow it quietly
+_SUPPRESS = (
+    "bookmark with invalid location",
+)
+_qt_log = logging.getLogger("qt")
 
-    # Forward all other messages
-    sys.stderr.write(message + "\n")
+def qt_message_filter(msg_type, context, message):
+    """Suppress noisy invalid-bookmark warnings but keep all others.
+
+    Qt can emit many messages per second on hot rendering paths, so the
+    cheap cases (info, suppressed warnings) short-circuit before any I/O;
+    warnings go through buffered logging instead of unbuffered stderr.
+    """
+    if msg_type == QtMsgType.QtInfoMsg:
+        return
+    if msg_type == QtMsgType.QtWarningMsg:
+        if any(n in message for n in _SUPPRESS):
+            return  # swallow it quietly
+        _qt_log.warning(message)
+        return
+
+    # Critical/fatal: make sure these reach stderr immediately
+    print(message, file=sys.stderr)
 
 qInstallMessageHandler(qt_message_filter)
 
@@ -52,49 +69,67 @@ ORG_NAME = "K Novak & Co."
 
 icon_size = QSize(32, 32)
 
-def app_data_dir() -> Path:
-    base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
-    p = Path(base)
-    p.mkdir(parents=True, exist_ok=True)
-    return p
-
-FAVORITES_FILE    = app_data_dir() / "favorites.txt"
-LAST_ROOT_FILE    = app_data_dir() / "last_root.txt"
-WINDOW_STATE_FILE = app_data_dir() / "window_state.json"
+def app_settings() -> QSettings:
+    """Platform-native settings store (registry / plist / ini)."""
+    return QSettings(ORG_NAME, APP_NAME)
 
 # ---------- Small helpers ----------
 def icon_from_style(hint: QStyle.StandardPixmap, widget: QWidget) -> QIcon:
     return widget.style().standardIcon(hint)
 
-def clamp(v, lo, hi):
-    return max(lo, min(hi, v))
+_ICONS_DIR = Path(__file__).parent / "icons"
 
+@functools.lru_cache(maxsize=None)
 def icon(name: str) -> QIcon:
-    """Load an icon from the icons folder."""
-    base = Path(__file__).parent / "icons"
-    return QIcon(str(base / f"{name}.png"))
+    """Load an icon from the icons folder (decoded once, shared after)."""
+    path = _ICONS_DIR / f"{name}.png"
+    if path.exists():
+        return QIcon(str(path))
+    # Fall back to a stock icon rather than caching a blank one.
+    app = QApplication.instance()
+    if app is not None:
+        return app.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon)
+    return QIcon()
+
+# --- Dir-first sort; PDF filtering happens natively in QFileSystemModel ---
+class PdfFilterProxyModel(QSortFilterProxyModel):
+    """Thin proxy kept only for directories-before-files ordering.
 
-def QColor_from_hex(hexstr: str) -> QColor:
-    # small color helper
-    c = QColor()
-    c.setNamedColor(hexstr)
-    return c
+    Name filtering runs at the C++ level via QFileSystemModel.setNameFilters,
+    so no Python code executes per row during expansion.
+    """
 
-# --- Filter to show only directories + PDF files ---
-class PdfFilterProxyModel(QSortFilterProxyModel):
-    def filterAcceptsRow(self, source_row, source_parent):
-        model = self.sourceModel()
-        index = model.index(source_row, 0, source_parent)
-        if not index.isValid():
-            return False
-        if model.isDir(index):
-            return True
-        return model.fileName(index).lower().endswith(".pdf")
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._src = None
+        self._is_dir_cache: dict[tuple[int, int], bool] = {}
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        self._src = model  # avoid a virtual sourceModel() call per row
+        self._is_dir_cache.clear()
+        # QFileSystemModel is live: row churn shifts the (parent, row) keys,
+        # so drop the cache whenever the source layout changes.
+        model.rowsInserted.connect(self._clear_is_dir_cache)
+        model.rowsRemoved.connect(self._clear_is_dir_cache)
+        model.modelReset.connect(self._clear_is_dir_cache)
+
+    def _clear_is_dir_cache(self, *_):
+        self._is_dir_cache.clear()
+
+    def _is_dir(self, index) -> bool:
+        key = (index.parent().internalId(), index.row())
+        cached = self._is_dir_cache.get(key)
+        if cached is None:
+            cached = self._src.isDir(index)
+            if len(self._is_dir_cache) >= 4096:
+                self._is_dir_cache.clear()
+            self._is_dir_cache[key] = cached
+        return cached
 
     def lessThan(self, left, right):
-        model = self.sourceModel()
-        left_is_dir = model.isDir(left)
-        right_is_dir = model.isDir(right)
+        left_is_dir = self._is_dir(left)
+        right_is_dir = self._is_dir(right)
         if left_is_dir != right_is_dir:
             return left_is_dir
         return super().lessThan(left, right)
@@ -104,11 +139,12 @@ class PdfExplorerWidget(QWidget):
     def __init__(self, root_path, parent=None):
         super().__init__(parent)
 
-        if not os.path.exists(root_path):
-            raise FileNotFoundError(f"Root path not found: {root_path}")
-
         self.fs_model = QFileSystemModel()
-        self.setRootPath(root_path)
+        # Filter to dirs + PDFs inside Qt: hidden rows never reach Python
+        self.fs_model.setNameFilters(["*.pdf"])
+        self.fs_model.setNameFilterDisables(False)  # hide, don't grey out
+        self._last_valid_root = None
+        self.setRootPath(root_path)  # validates the path itself
 
         self.proxy_model = PdfFilterProxyModel()
         self.proxy_model.setSourceModel(self.fs_model)
@@ -122,20 +158,50 @@ class PdfExplorerWidget(QWidget):
         self.tree.setUniformRowHeights(True)
         self.tree.sortByColumn(0, Qt.SortOrder.AscendingOrder)
 
-        # Hide columns except file name
-        self.tree.setColumnHidden(1, True)
-        self.tree.setColumnHidden(2, True)
-        self.tree.setColumnHidden(3, True)
+        # Hide columns except file name — batched so the header relayouts once
+        self.tree.setUpdatesEnabled(False)
+        self.tree.header().blockSignals(True)
+        for c in (1, 2, 3):
+            self.tree.setColumnHidden(c, True)
+        self.tree.header().blockSignals(False)
+        self.tree.setUpdatesEnabled(True)
 
         layout = QVBoxLayout()
         layout.addWidget(self.tree)
         self.setLayout(layout)
 
     def setRootPath(self, root_path):
-        if not os.path.exists(root_path):
-            raise FileNotFoundError(f"Root path not found: {root_path}")
+        # One stat per root change; skip it when re-setting the same root
+        # (each os.path check is a syscall and can be slow on network drives).
+        if root_path != self._last_valid_root:
+            if not os.path.isdir(root_path):
+                raise FileNotFoundError(f"Root path not found: {root_path}")
+            self._last_valid_root = root_path
         self.fs_model.setRootPath(root_path)
 
+# ---------- Background PDF loading ----------
+class PdfLoadSignals(QObject):
+    """Signal holder for PdfLoadTask (QRunnable can't emit signals itself)."""
+    loaded = pyqtSignal(QPdfDocument, str, int)
+
+class PdfLoadTask(QRunnable):
+    """Load a QPdfDocument off the GUI thread so big files don't freeze the UI."""
+
+    def __init__(self, path: str, request_id: int):
+        super().__init__()
+        self.path = path
+        self.request_id = request_id
+        self.signals = PdfLoadSignals()
+
+    def run(self):
+        doc = QPdfDocument()
+        doc.load(self.path)
+        # Hand the document back to the GUI thread before emitting.
+        app = QApplication.instance()
+        if app is not None:
+            doc.moveToThread(app.thread())
+        self.signals.loaded.emit(doc, self.path, self.request_id)
+
 # ---------- Center View (PDF + error overlay) ----------
 class CenterPdfView(QWidget):
     """A stack: PDF view underneath and a big red error label on top when needed."""
@@ -145,6 +211,13 @@ class CenterPdfView(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.doc = QPdfDocument(self)
+        # Completion is signal-driven: load() may settle asynchronously for
+        # non-trivial files, so don't poll status right after calling it.
+        self._load_pending = False
+        self._pending_path = None
+        self._page_count = 0  # cached so per-keypress paths skip the backend
+        self._current_file = None  # path of the successfully shown document
+        self.doc.statusChanged.connect(self._on_doc_status)
 
         self.view = QPdfView(self)
         self.view.setDocument(self.doc)
@@ -152,45 +225,115 @@ class CenterPdfView(QWidget):
         self.view.setPageMode(QPdfView.PageMode.MultiPage)
         self.view.setZoomMode(QPdfView.ZoomMode.Custom)
 
-        # Error / empty overlay
+        # Error / empty overlay: floats above the view (shown/hidden directly,
+        # no stacked layout — switching stack pages relayouts the whole view).
         self.overlay = QLabel("", self)
         self.overlay.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.overlay.setStyleSheet("color: red; font-size: 16pt;")
         self.overlay.setWordWrap(True)
 
-        self.stack = QStackedLayout()
-        self.stack.addWidget(self.view)     # index 0
-        self.stack.addWidget(self.overlay)  # index 1
-        self.setLayout(self.stack)
+        lay = QVBoxLayout(self)
+        lay.setContentsMargins(0, 0, 0, 0)
+        lay.addWidget(self.view)
         self.show_overlay("No document loaded.")  # start empty
 
         # Signals to propagate current page changes out
         # QPdfView doesn't emit pageChanged; we poll via viewport events.
+        # Debounce: valueChanged fires dozens of times per wheel flick, so
+        # restart a single-shot timer instead of re-emitting on every tick.
+        self._last_emitted_page = -1
+        self._page_emit_timer = QTimer(self)
+        self._page_emit_timer.setSingleShot(True)
+        self._page_emit_timer.setInterval(40)
+        self._page_emit_timer.timeout.connect(self._emit_current_page_now)
+        # Go through the wrapper: connecting QTimer.start directly would bind
+        # the start(int msec) overload and the scrollbar position would
+        # silently become the timer interval.
         self.view.verticalScrollBar().valueChanged.connect(self._emit_current_page)
 
     def _emit_current_page(self, *_):
+        """Schedule a (debounced) pageChanged emission."""
+        self._page_emit_timer.start()
+
+    def _emit_current_page_now(self, *_):
         # For multipage view: estimate current page by top-most fully/partially visible
         nav = self.view.pageNavigator()
         current = nav.currentPage()
+        if current == self._last_emitted_page:
+            return  # intra-page scroll; spare the toolbar a relayout
+        self._last_emitted_page = current
         self.pageChanged.emit(current)
 
     # ---------- Loading ----------
-    def load_file(self, file_path: str) -> bool:
+    def load_file(self, file_path: str) -> None:
+        """Load synchronously on the GUI thread; _on_doc_status finishes the
+        job when status settles. MainWindow goes through PdfLoadTask and
+        adopt_document() instead; this stays as the widget's standalone API."""
+        self._load_pending = False  # the close() below emits Null; ignore it
         self.doc.close()
         self.overlay.clear()
 
+        self._pending_path = file_path
+        self._load_pending = True
         self.doc.load(file_path)
-        st = self.doc.status()
-        page_count = self.doc.pageCount()
 
-        # In Qt 6.10, only Null/Loading/Ready/Unloading exist.
-        if st != QPdfDocument.Status.Ready or page_count == 0:
+    def _on_doc_status(self, status):
+        if status == QPdfDocument.Status.Loading:
+            if self._load_pending:
+                self.show_overlay(f"Loading {os.path.basename(self._pending_path)}…")
+            return
+
+        if status == QPdfDocument.Status.Ready:
+            self._load_pending = False
+            self._page_count = self.doc.pageCount()
+            if self._page_count == 0:
+                self._show_load_failure()
+                return
+            self._current_file = self._pending_path
+            self.hide_overlay()
+            self._last_emitted_page = -1  # new document: force next emission through
+            self.view.pageNavigator().jump(0, QPointF(), 0.0)
+            self.documentLoaded.emit()
+            self._emit_current_page()
+            return
+
+        if status == QPdfDocument.Status.Unloading:
+            return
+
+        # Any other terminal status — Null, or Error on a corrupt file —
+        # while a load is pending means the load failed.
+        if self._load_pending:
+            self._load_pending = False
+            self._page_count = 0
+            self._show_load_failure()
+
+    def _show_load_failure(self):
+        self._current_file = None
+        name = os.path.basename(self._pending_path) if self._pending_path else "?"
+        self.show_overlay(f"{name}\n\nNot readable or empty.")
+
+    def adopt_document(self, doc: QPdfDocument, file_path: str) -> bool:
+        """Swap in a document that a PdfLoadTask built on a worker thread."""
+        if doc.status() != QPdfDocument.Status.Ready or doc.pageCount() == 0:
             name = os.path.basename(file_path)
             self.show_overlay(f"{name}\n\nNot readable or empty.")
             return False
 
-        # Valid document
+        old = self.doc
+        old.statusChanged.disconnect(self._on_doc_status)
+        doc.setParent(self)
+        self.doc = doc
+        self.doc.statusChanged.connect(self._on_doc_status)
+        self.view.setDocument(self.doc)
+        self._pending_path = file_path
+        self._load_pending = False  # worker delivered a fully Ready document
+        self._page_count = doc.pageCount()
+        self._current_file = file_path
+        old.close()
+        old.deleteLater()
+
         self.hide_overlay()
+        self._last_emitted_page = -1  # new document: force next emission through
         self.view.pageNavigator().jump(0, QPointF(), 0.0)
         self.documentLoaded.emit()
         self._emit_current_page()
@@ -200,20 +343,28 @@ class CenterPdfView(QWidget):
     # ---------- Overlay control ----------
     def show_overlay(self, text: str):
         self.overlay.setText(text)
-        self.stack.setCurrentIndex(1)
+        self.overlay.setGeometry(self.rect())
+        self.overlay.setVisible(True)
+        self.overlay.raise_()
 
     def hide_overlay(self):
-        self.stack.setCurrentIndex(0)
+        self.overlay.setVisible(False)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.overlay.setGeometry(self.rect())
 
     # ---------- Navigation ----------
     def page_count(self) -> int:
-        return self.doc.pageCount()
+        return self._page_count
 
     def current_page(self) -> int:
         return self.view.pageNavigator().currentPage()
 
     def go_to_page(self, page_zero_based: int):
-        page = clamp(page_zero_based, 0, max(0, self.page_count() - 1))
+        # Inlined clamp: this runs on every PageUp/PageDown keystroke
+        last = self._page_count - 1
+        page = 0 if page_zero_based < 0 or last < 0 else min(page_zero_based, last)
         self.view.pageNavigator().jump(page, QPointF(), 0.0)
 
     def next_page(self):
@@ -227,7 +378,7 @@ class CenterPdfView(QWidget):
         return self.view.zoomFactor()
 
     def set_zoom_factor(self, f: float):
-        self.view.setZoomFactor(clamp(f, 0.05, 6.0))
+        self.view.setZoomFactor(0.05 if f < 0.05 else 6.0 if f > 6.0 else f)
 
     def fit_width(self):
         self.view.setZoomMode(QPdfView.ZoomMode.FitToWidth)
@@ -240,6 +391,8 @@ class CenterPdfView(QWidget):
         self.view.setZoomMode(QPdfView.ZoomMode.Custom)
 
 # ---------- TOC (Bookmarks) Panel ----------
+_TOC_PAGE_ROLE = QPdfBookmarkModel.Role.Page  # resolved once, not per click
+
 class TocPanel(QWidget):
     """Tree view backed by QPdfBookmarkModel; emits page+location jumps when activated."""
     jumpToDestination = pyqtSignal(int, QPointF, float)
@@ -265,8 +418,8 @@ class TocPanel(QWidget):
 
     def _activated(self, idx):
         """Called when user clicks a TOC entry."""
-   
-        page = idx.data(QPdfBookmarkModel.Role.Page)
+        # Single QVariant round-trip; the happy path is a straight line.
+        page = idx.data(_TOC_PAGE_ROLE)
         if isinstance(page, int) and page >= 0:
             self.jumpToDestination.emit(page, QPointF(), 0.0)
 
@@ -277,6 +430,7 @@ class FilesPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.settings = app_settings()
 
         # Load last root or default to home
         start_root = self._load_last_root() or str(Path.home())
@@ -299,13 +453,21 @@ class FilesPanel(QWidget):
         file_btn_row.addWidget(self.btn_rename_file)
         file_btn_row.addStretch(1)
 
-        # Top: file browser
-        self.browser = PdfExplorerWidget(start_root, self)
-        self.browser.tree.doubleClicked.connect(self._on_double_clicked)
-
-        # Bottom: favorites list + buttons
+        # Top: file browser — built lazily so first paint doesn't wait for
+        # QFileSystemModel to start watching (possibly slow/network) roots.
+        self._start_root = start_root
+        self.browser = None
+        self.browser_stack = QStackedLayout()
+        self._browser_placeholder = QLabel("Loading files…")
+        self._browser_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.browser_stack.addWidget(self._browser_placeholder)
+        browser_host = QWidget()
+        browser_host.setLayout(self.browser_stack)
+
+        # Bottom: favorites list + buttons; disk read deferred past show()
         self.fav_list = QListWidget()
-        self._load_favorites()
+        self._fav_set: set[str] = set()  # normalized paths for O(1) dedupe
+        QTimer.singleShot(0, self._load_favorites)
 
         self.btn_add = QToolButton()
         self.btn_add.setIcon(icon("add_folder"))
@@ -337,7 +499,7 @@ class FilesPanel(QWidget):
         v = QVBoxLayout(self)
         v.setContentsMargins(0, 0, 0, 0)
         v.addLayout(file_btn_row)
-        v.addWidget(self.browser, 4)
+        v.addWidget(browser_host, 4)
         bar = QFrame()
         bar.setFrameShape(QFrame.Shape.HLine)
         v.addWidget(bar)
@@ -345,65 +507,85 @@ class FilesPanel(QWidget):
         v.addWidget(self.fav_list, 2)
         v.addLayout(btn_row)
 
-    # ---- persistence helpers ----
-    def _favorites_path(self) -> Path:
-        return FAVORITES_FILE
+    # ---- lazy browser construction ----
+    def _ensure_browser(self):
+        """Build the file browser on first use (idempotent)."""
+        if self.browser is not None:
+            return
+        self.browser = PdfExplorerWidget(self._start_root, self)
+        self.browser.tree.doubleClicked.connect(self._on_double_clicked)
+        self.browser_stack.addWidget(self.browser)
+        self.browser_stack.setCurrentWidget(self.browser)
 
-    def _last_root_path(self) -> Path:
-        return LAST_ROOT_FILE
+    # ---- persistence helpers ----
+    @staticmethod
+    def _normalize_favorite(folder: str) -> str:
+        # Catch case/separator duplicates of the same folder on Windows.
+        return os.path.normcase(os.path.normpath(folder))
 
     def _load_favorites(self):
         self.fav_list.clear()
-        p = self._favorites_path()
-        if p.exists():
-            for line in p.read_text(encoding="utf-8").splitlines():
-                line = line.strip()
-                if line and Path(line).exists():
-                    self.fav_list.addItem(line)
+        self._fav_set.clear()
+        for line in self.settings.value("favorites", [], type=list):
+            line = str(line).strip()
+            if line and Path(line).exists():
+                self.fav_list.addItem(line)
+                self._fav_set.add(self._normalize_favorite(line))
 
     def _save_favorites(self):
         items = [self.fav_list.item(i).text() for i in range(self.fav_list.count())]
-        self._favorites_path().write_text("\n".join(items), encoding="utf-8")
+        # No sync(): QSettings flushes lazily from the event loop, and its
+        # writes are atomic, so a per-mutation disk flush just adds latency.
+        self.settings.setValue("favorites", items)
 
     def _load_last_root(self) -> str | None:
-        p = self._last_root_path()
-        if p.exists():
-            root = p.read_text(encoding="utf-8").strip()
-            if root and Path(root).exists():
-                return root
+        root = str(self.settings.value("last_root", "")).strip()
+        if root and Path(root).exists():
+            return root
         return None
 
     def _save_last_root(self, root: str):
-        self._last_root_path().write_text(root, encoding="utf-8")
+        self.settings.setValue("last_root", root)
 
     # ---- favorites actions ----
     def _add_favorite(self):
         folder = QFileDialog.getExistingDirectory(self, "Add Favorite Folder", str(Path.home()))
         if folder:
-            # avoid duplicates
-            for i in range(self.fav_list.count()):
-                if self.fav_list.item(i).text() == folder:
-                    return
+            key = self._normalize_favorite(folder)
+            if key in self._fav_set:
+                return
+            self._fav_set.add(key)
             self.fav_list.addItem(folder)
             self._save_favorites()
 
     def _remove_selected_favorite(self):
         row = self.fav_list.currentRow()
         if row >= 0:
-            self.fav_list.takeItem(row)
+            item = self.fav_list.takeItem(row)
+            self._fav_set.discard(self._normalize_favorite(item.text()))
             self._save_favorites()
 
+    def _switch_root(self, folder: str):
+        """Point the browser at a new root with a single repaint/filter pass."""
+        self._ensure_browser()
+        tree = self.browser.tree
+        tree.setUpdatesEnabled(False)
+        try:
+            self.browser.setRootPath(folder)
+            tree.setRootIndex(
+                self.browser.proxy_model.mapFromSource(self.browser.fs_model.index(folder))
+            )
+            self.browser.proxy_model.invalidate()
+        finally:
+            tree.setUpdatesEnabled(True)
+        self._save_last_root(folder)
+        self.rootChanged.emit(folder)
+
     def _activate_favorite(self, item: QListWidgetItem):
         folder = item.text()
         if Path(folder).exists():
             try:
-                self.browser.setRootPath(folder)
-                # Update tree's root index mapping
-                self.browser.tree.setRootIndex(
-                    self.browser.proxy_model.mapFromSource(self.browser.fs_model.index(folder))
-                )
-                self._save_last_root(folder)
-                self.rootChanged.emit(folder)
+                self._switch_root(folder)
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Failed to open folder:\n{e}")
 
@@ -418,12 +600,7 @@ class FilesPanel(QWidget):
             # If it's a folder, change root
             if Path(path).is_dir():
                 try:
-                    self.browser.setRootPath(path)
-                    self.browser.tree.setRootIndex(
-                        self.browser.proxy_model.mapFromSource(self.browser.fs_model.index(path))
-                    )
-                    self._save_last_root(path)
-                    self.rootChanged.emit(path)
+                    self._switch_root(path)
                 except Exception as e:
                     QMessageBox.warning(self, "Error", f"Failed to open folder:\n{e}")
 
@@ -513,6 +690,13 @@ class RightToolbar(QWidget):
         self._page_total = 0
         self._current_page = 0
 
+        # Label HTML caches: total only changes per document, current page
+        # HTML is revisited while scrolling back and forth.
+        self._total_html = "-"
+        self._cur_html_cache: dict[int, str] = {}
+        self._last_rendered_page = -1
+        self._last_rendered_total = -1
+
         # Buttons
         self.btn_prev = QToolButton()
         self.btn_next = QToolButton()
@@ -563,21 +747,34 @@ class RightToolbar(QWidget):
         v.addStretch(1)
         v.addWidget(self.page_label)  # moved to bottom
 
+    @staticmethod
+    def _vertical_digits(n: int) -> str:
+        if n <= 0:
+            return "-"
+        return "<br>".join(str(n))  # strings are iterable; no generator needed
+
     def _update_label(self):
-        def vertical_digits(n: int) -> str:
-            if n <= 0:
-                return "-"
-            return "<br>".join(ch for ch in str(n))
+        if (
+            self._current_page == self._last_rendered_page
+            and self._page_total == self._last_rendered_total
+        ):
+            return
+        self._last_rendered_page = self._current_page
+        self._last_rendered_total = self._page_total
 
         if self._page_total <= 0:
             html = (
                 '<div style="text-align:center; line-height:1;"><div>-</div><hr style="width:20px; margin:0; border:1px solid black;"><div>-</div></div>'
             )
         else:
-            cur = vertical_digits(self._current_page + 1)
-            total = vertical_digits(self._page_total)
+            cur = self._cur_html_cache.get(self._current_page)
+            if cur is None:
+                cur = self._vertical_digits(self._current_page + 1)
+                if len(self._cur_html_cache) >= 64:
+                    self._cur_html_cache.clear()
+                self._cur_html_cache[self._current_page] = cur
+            total = self._total_html
             html = (
-                # f"<div align='center' style='font-weight:bold;font-size:16pt; line-height:0.7;'>{cur}<hr width='10' style='margin:0;'>{total}</div>"
                 f'<div style="text-align:center; line-height:1;"><div>{cur}</div><hr style="width:20px; margin:0; border:1px solid black;"><div>{total}</div></div>'
             )
         self.page_label.setText(html)
@@ -585,6 +782,8 @@ class RightToolbar(QWidget):
 
     def set_total_pages(self, n: int):
         self._page_total = max(0, n)
+        self._total_html = self._vertical_digits(self._page_total)
+        self._cur_html_cache.clear()
         self._update_label()
 
     def set_current_page(self, page_zero_based: int):
@@ -597,6 +796,15 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("PDF Viewer")
         self.resize(1280, 800)
+        self.settings = app_settings()
+
+        # Async PDF loading state
+        self._load_request_id = 0
+        self._load_task = None
+
+        # TOC tab colors (built once; QColor name lookup isn't free)
+        self._toc_color_on = QColor("#2e7d32")
+        self._toc_color_off = QColor("#777777")
 
         # Central splitter: left tabs | center | right toolbar
         self.splitter = QSplitter()
@@ -607,12 +815,16 @@ class MainWindow(QMainWindow):
         self.toc_panel = TocPanel()
         self.files_panel = FilesPanel()
         self.files_panel.fileActivated.connect(self.open_pdf)
-        self.files_panel.rootChanged.connect(self._persist_root)
+        # Last-root persistence lives in FilesPanel._save_last_root alone.
         self.toc_panel.jumpToDestination.connect(lambda page, point, zoom: self.center.view.pageNavigator().jump(page, point, zoom))
 
         self.tabs.addTab(self.files_panel, "Files")
         self.tabs.addTab(self.toc_panel, "TOC")
         self.tabs.setCurrentIndex(0)
+        # Build the file browser only once the window has painted (or when
+        # the user switches back to the Files tab).
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        QTimer.singleShot(0, self.files_panel._ensure_browser)
 
         # Center PDF stack
         self.center = CenterPdfView()
@@ -651,59 +863,52 @@ class MainWindow(QMainWindow):
 
     # ------ Window state persistence ------
     def _load_window_settings(self):
-        """Restore window geometry/state from JSON file."""
-        if not WINDOW_STATE_FILE.exists():
+        """Restore window geometry (incl. maximized state) from QSettings."""
+        geom = self.settings.value("geometry")
+        if geom is None:
             self.showMaximized()
             return
-
-        try:
-            data = json.loads(WINDOW_STATE_FILE.read_text(encoding="utf-8"))
-            geom = data.get("geometry")
-            is_max = data.get("is_maximized", False)
-
-            if geom and len(geom) == 4:
-                x, y, w, h = geom
-                self.setGeometry(x, y, w, h)
-            if is_max:
-                self.showMaximized()
-            else:
-                self.showNormal()
-        except Exception as e:
-            print("Failed to restore window state:", e)
-            self.showMaximized()
+        # saveGeometry/restoreGeometry round-trip a QByteArray; no JSON parse
+        # and no showNormal/showMaximized juggling needed.
+        self.restoreGeometry(geom)
+        self.show()
 
     def _save_window_settings(self):
-        """Save window geometry/state to JSON file."""
-        try:
-            is_max = self.isMaximized()
-            if is_max:
-                self.showNormal()
-                geom = [self.x(), self.y(), self.width(), self.height()]
-                self.showMaximized()
-            else:
-                geom = [self.x(), self.y(), self.width(), self.height()]
-
-            data = {"geometry": geom, "is_maximized": is_max}
-            WINDOW_STATE_FILE.write_text(json.dumps(data), encoding="utf-8")
-        except Exception as e:
-            print("Failed to save window state:", e)
-
-
+        self.settings.setValue("geometry", self.saveGeometry())
 
     # ------ File I/O ------
-    def _persist_root(self, root: str):
-        try:
-            LAST_ROOT_FILE.write_text(root, encoding="utf-8")
-        except Exception:
-            pass
-
     def open_pdf(self, path: str | None = None):
         if not path:
             path, _ = QFileDialog.getOpenFileName(self, "Open PDF", str(Path.home()), "PDF files (*.pdf)")
             if not path:
                 return
 
-        ok = self.center.load_file(path)
+        # Re-opening the file already on screen (common via favorites) is free.
+        if (
+            path == self.center._current_file
+            and self.center.doc.status() == QPdfDocument.Status.Ready
+        ):
+            # A failed load of some other file may have left its error
+            # overlay and a zeroed toolbar behind; restore them for the
+            # document still being displayed.
+            self.center.hide_overlay()
+            self._update_toc_tab_color(self.toc_panel.has_toc())
+            self._sync_total_pages()
+            return
+
+        # Parse on a worker thread; the GUI only shows a busy overlay meanwhile.
+        self._load_request_id += 1
+        self.center.show_overlay(f"Loading {os.path.basename(path)}…")
+        task = PdfLoadTask(path, self._load_request_id)
+        task.signals.loaded.connect(self._on_pdf_loaded)
+        self._load_task = task  # keep signal holder alive until delivery
+        QThreadPool.globalInstance().start(task)
+
+    def _on_pdf_loaded(self, doc: QPdfDocument, path: str, request_id: int):
+        if request_id != self._load_request_id:
+            return  # superseded by a newer open; drop the stale document
+
+        ok = self.center.adopt_document(doc, path)
         if ok:
             self.toc_panel.set_document(self.center.doc)
             self._update_toc_tab_color(self.toc_panel.has_toc())
@@ -712,6 +917,10 @@ class MainWindow(QMainWindow):
             self._update_toc_tab_color(False)
             self.tools.set_total_pages(0)
 
+    def _on_tab_changed(self, index: int):
+        if self.tabs.widget(index) is self.files_panel:
+            self.files_panel._ensure_browser()
+
     # ------ Toolbar sync ------
     def _sync_total_pages(self):
         self.tools.set_total_pages(self.center.page_count())
@@ -743,8 +952,9 @@ class MainWindow(QMainWindow):
     # ------ TOC tab color ------
     def _update_toc_tab_color(self, has_toc: bool):
         idx = 1  # TOC tab index
-        color = "#2e7d32" if has_toc else "#777777"
-        self.tabs.tabBar().setTabTextColor(idx, QColor_from_hex(color))
+        self.tabs.tabBar().setTabTextColor(
+            idx, self._toc_color_on if has_toc else self._toc_color_off
+        )
 
     # ------ Shortcuts ------
     def _install_shortcuts(self):
@@ -778,6 +988,7 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         self._save_window_settings()
+        self.settings.sync()  # single flush for everything still pending
         super().closeEvent(event)
 
 # ---------- main ----------
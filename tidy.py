@@ -1,4 +1,7 @@
-import sys, subprocess
+import bisect
+import ctypes
+import os
+import sys
 from pathlib import Path
 
 from PyQt6.QtPdf import *
@@ -9,24 +12,358 @@ from PyQt6.QtGui import *
 
 APP_NAME = "Pdf Viewer"
 
-# --- Filter to show only directories + PDF files ---
-class PdfFilterProxyModel(QSortFilterProxyModel):
-    def filterAcceptsRow(self, source_row, source_parent):
-        model = self.sourceModel()
-        index = model.index(source_row, 0, source_parent)
+def _reveal_in_explorer_native(path: str) -> bool:
+    """Select `path` in Explorer via shell32 directly — no process spawn.
+
+    Returns False on any failure (including non-Windows) so the caller can
+    fall back to launching explorer.exe detached.
+    """
+    try:
+        ole32 = ctypes.windll.ole32
+        shell32 = ctypes.windll.shell32
+    except AttributeError:
+        return False  # not Windows
+    ole32.CoInitialize(None)
+    try:
+        pidl = ctypes.c_void_p()
+        sfgao = ctypes.c_ulong()
+        hr = shell32.SHParseDisplayName(
+            ctypes.c_wchar_p(str(Path(path))), None, ctypes.byref(pidl), 0, ctypes.byref(sfgao)
+        )
+        if hr != 0 or not pidl:
+            return False
+        try:
+            return shell32.SHOpenFolderAndSelectItems(pidl, 0, None, 0) == 0
+        finally:
+            ole32.CoTaskMemFree(pidl)
+    except OSError:
+        return False
+    finally:
+        ole32.CoUninitialize()
+
+# --- Model showing only directories + PDF files ---
+class _FsNode:
+    """One directory entry; children stay None until the dir is enumerated."""
+    __slots__ = ("name", "path", "is_dir", "mtime", "parent", "row", "children",
+                 "loaded", "scanning")
+
+    def __init__(self, name, path, is_dir, mtime, parent=None, row=0):
+        self.name = name
+        self.path = path
+        self.is_dir = is_dir
+        self.mtime = mtime
+        self.parent = parent
+        self.row = row
+        self.children = None
+        self.loaded = False
+        self.scanning = False
+
+_SCAN_CHUNK = 512
+
+def _is_pdf_name(name: str) -> bool:
+    """Accept filter for file entries; evaluated once per entry at scandir
+    time, and the result is baked into the node — never re-queried when Qt
+    re-visits rows on sort/expand/resize."""
+    # Lowercase only the extension, not a full copy of every filename
+    head, sep, ext = name.rpartition(".")
+    return sep == "." and ext.lower() == "pdf"
+
+class _DirScanSignals(QObject):
+    # (parent node, entry tuples, generation) — queued back to the GUI thread
+    chunk = pyqtSignal(object, list, int)
+    done = pyqtSignal(object, int)
+    refreshed = pyqtSignal(object, list, int)  # full re-listing, for diffing
+
+class _DirScanTask(QRunnable):
+    """Enumerate one directory on a pool thread, emitting fixed-size chunks."""
+
+    def __init__(self, node, generation):
+        super().__init__()
+        self.node = node
+        self.generation = generation
+        self.signals = _DirScanSignals()
+
+    def run(self):
+        entries = PdfFsModel._list_dir(self.node.path)
+        for i in range(0, len(entries), _SCAN_CHUNK):
+            self.signals.chunk.emit(self.node, entries[i:i + _SCAN_CHUNK], self.generation)
+        self.signals.done.emit(self.node, self.generation)
+
+class _DirRefreshTask(QRunnable):
+    """Re-list an already-loaded directory so the model can diff it."""
+
+    def __init__(self, node, generation):
+        super().__init__()
+        self.node = node
+        self.generation = generation
+        self.signals = _DirScanSignals()
+
+    def run(self):
+        entries = PdfFsModel._list_dir(self.node.path)
+        self.signals.refreshed.emit(self.node, entries, self.generation)
+
+class PdfFsModel(QAbstractItemModel):
+    """Lazy filesystem model that filters to dirs + PDFs at scandir time.
+
+    Unlike QFileSystemModel + a filter proxy, non-PDF entries are skipped
+    while enumerating, so no per-row Python callback ever runs for them,
+    and directories are listed on demand only when expanded. Children are
+    stored dirs-first, name-sorted, so no lessThan comparisons are needed.
+    """
+
+    def __init__(self, root_path=None, parent=None):
+        super().__init__(parent)
+        self._root = None
+        self._generation = 0  # bumped on reset so stale worker chunks drop out
+        self._tasks = set()   # keep signal holders alive until done fires
+        self._by_path = {}    # path -> loaded node, for targeted row removal
+        # Two shared icons fetched once — QFileSystemModel's per-file icon
+        # pipeline is pathologically slow on Qt6, and we only ever show
+        # folders and PDFs anyway.
+        provider = QFileIconProvider()
+        self._dir_icon = provider.icon(QFileIconProvider.IconType.Folder)
+        self._file_icon = provider.icon(QFileIconProvider.IconType.File)
+        # One watcher, re-pointed at the current root only — a watch handle
+        # per visited directory (QFileSystemModel's approach) doesn't scale.
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        if root_path is not None:
+            self.setRootPath(root_path)
+
+    # --- population ---
+    def setRootPath(self, root_path):
+        self.beginResetModel()
+        self._generation += 1
+        self._root = _FsNode(str(root_path), str(root_path), True, 0.0)
+        self._by_path.clear()
+        self.endResetModel()
+        old = self._watcher.directories()
+        if old:
+            self._watcher.removePaths(old)
+        self._watcher.addPath(str(root_path))
+
+    @staticmethod
+    def _list_dir(path):
+        """Enumerate + filter + sort one directory (runs on a worker thread)."""
+        accepted = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir or _is_pdf_name(entry.name):
+                        # entry.stat() reuses what the directory listing
+                        # already fetched where the OS provides it, instead
+                        # of a fresh os.stat() syscall per entry.
+                        try:
+                            mtime = entry.stat(follow_symlinks=False).st_mtime
+                        except OSError:
+                            mtime = 0.0
+                        accepted.append((entry.name, entry.path, is_dir, mtime))
+        except OSError:
+            return []
+        # One C-implemented sort, dirs first then case-insensitive by name;
+        # runs here on the worker so the GUI thread never compares anything.
+        accepted.sort(key=lambda e: (not e[2], e[0].casefold()))
+        return accepted
+
+    def _parent_index(self, node):
+        if node is self._root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def _on_scan_chunk(self, node, entries, generation):
+        if generation != self._generation:
+            return  # root changed while the worker was scanning
+        if node.children is None:
+            node.children = []
+        first = len(node.children)
+        self.beginInsertRows(self._parent_index(node), first, first + len(entries) - 1)
+        for offset, (name, path, is_dir, mtime) in enumerate(entries):
+            child = _FsNode(name, path, is_dir, mtime, node, first + offset)
+            node.children.append(child)
+            self._by_path[path] = child
+        self.endInsertRows()
+
+    def _on_scan_done(self, node, generation):
+        if generation == self._generation:
+            node.loaded = True
+            node.scanning = False
+            if node.children is None:
+                node.children = []
+        self._tasks = {t for t in self._tasks if t.node is not node}
+
+    def _node(self, index):
+        return index.internalPointer() if index.isValid() else self._root
+
+    # --- QAbstractItemModel interface ---
+    def index(self, row, column, parent=QModelIndex()):
+        node = self._node(parent)
+        if (
+            node is None or node.children is None
+            or column != 0 or not 0 <= row < len(node.children)
+        ):
+            return QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index):
+        node = index.internalPointer() if index.isValid() else None
+        if node is None or node.parent is None or node.parent is self._root:
+            return QModelIndex()
+        return self.createIndex(node.parent.row, 0, node.parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        node = self._node(parent)
+        if node is None or node.children is None:
+            return 0
+        return len(node.children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self._node(parent)
+        if node is None or not node.is_dir:
+            return False
+        if node.children is None:
+            return True  # assume yes until enumerated; keeps the expander
+        return bool(node.children)
+
+    def canFetchMore(self, parent):
+        # Stays True until the scan worker signals completion
+        node = self._node(parent)
+        return node is not None and node.is_dir and not node.loaded
+
+    def fetchMore(self, parent):
+        node = self._node(parent)
+        if node is None or node.loaded or node.scanning:
+            return
+        node.scanning = True
+        task = _DirScanTask(node, self._generation)
+        task.signals.chunk.connect(self._on_scan_chunk)
+        task.signals.done.connect(self._on_scan_done)
+        self._tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
         if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return index.internalPointer().name
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._dir_icon if index.internalPointer().is_dir else self._file_icon
+        return None
+
+    def _on_directory_changed(self, path):
+        node = self._root
+        if node is None or path != node.path or not node.loaded:
+            return
+        task = _DirRefreshTask(node, self._generation)
+        task.signals.refreshed.connect(self._on_dir_refreshed)
+        self._tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_dir_refreshed(self, node, entries, generation):
+        self._tasks = {t for t in self._tasks if not isinstance(t, _DirRefreshTask) or t.node is not node}
+        if generation != self._generation or node.children is None:
+            return
+
+        # Diff against the cached children; emit minimal row changes
+        new_paths = {path for (_, path, _, _) in entries}
+        for child in [c for c in node.children if c.path not in new_paths]:
+            self.removePath(child.path)
+
+        existing = {c.path for c in node.children}
+        for name, path, is_dir, mtime in entries:
+            if path in existing:
+                continue
+            self._insert_child(node, name, path, is_dir, mtime)
+
+    def _insert_child(self, node, name, path, is_dir, mtime):
+        """Insert one entry into an enumerated directory at its sorted slot."""
+        key = (not is_dir, name.casefold())
+        keys = [(not c.is_dir, c.name.casefold()) for c in node.children]
+        row = bisect.bisect_left(keys, key)
+        self.beginInsertRows(self._parent_index(node), row, row)
+        child = _FsNode(name, path, is_dir, mtime, node, row)
+        node.children.insert(row, child)
+        for i in range(row + 1, len(node.children)):
+            node.children[i].row = i
+        self._by_path[path] = child
+        self.endInsertRows()
+
+    def removePath(self, path):
+        """Drop the row for a path that no longer exists on disk."""
+        node = self._by_path.pop(path, None)
+        if node is None or node.parent is None or node.parent.children is None:
+            return
+        row = node.row
+        self.beginRemoveRows(self._parent_index(node.parent), row, row)
+        del node.parent.children[row]
+        for i in range(row, len(node.parent.children)):
+            node.parent.children[i].row = i
+        self.endRemoveRows()
+
+    # --- drag and drop (move files between folders) ---
+    def flags(self, index):
+        base = super().flags(index)
+        if not index.isValid() or index.internalPointer().is_dir:
+            return base | Qt.ItemFlag.ItemIsDropEnabled
+        return base | Qt.ItemFlag.ItemIsDragEnabled
+
+    def supportedDropActions(self):
+        return Qt.DropAction.MoveAction
+
+    def mimeTypes(self):
+        return ["text/uri-list"]
+
+    def mimeData(self, indexes):
+        mime = QMimeData()
+        mime.setUrls([QUrl.fromLocalFile(self.filePath(index))
+                      for index in indexes if index.isValid()])
+        return mime
+
+    def dropMimeData(self, data, action, row, column, parent):
+        if action != Qt.DropAction.MoveAction or not data.hasUrls():
             return False
-        if model.isDir(index):
-            return True
-        return model.fileName(index).lower().endswith(".pdf")
-
-    def lessThan(self, left, right):
-        model = self.sourceModel()
-        left_is_dir = model.isDir(left)
-        right_is_dir = model.isDir(right)
-        if left_is_dir != right_is_dir:
-            return left_is_dir
-        return super().lessThan(left, right)
+        target = self._node(parent)
+        if target is None:
+            return False
+        if not target.is_dir:
+            target = target.parent  # dropped onto a file row: use its folder
+        moved = False
+        for url in data.urls():
+            src = url.toLocalFile()
+            if not src:
+                continue
+            name = os.path.basename(src)
+            dest = os.path.join(target.path, name)
+            if src == dest or os.path.exists(dest):
+                continue  # no-op drop, or a name collision we won't clobber
+            try:
+                os.rename(src, dest)
+            except OSError:
+                continue  # cross-device or permission failure; keep the row
+            moved = True
+            self.removePath(src)
+            if target.children is not None:
+                try:
+                    mtime = os.stat(dest, follow_symlinks=False).st_mtime
+                except OSError:
+                    mtime = 0.0
+                self._insert_child(target, name, dest, False, mtime)
+        return moved
+
+    # --- QFileSystemModel-compatible helpers ---
+    def filePath(self, index):
+        node = self._node(index)
+        return node.path if node is not None else ""
+
+    def isDir(self, index):
+        node = self._node(index)
+        return node.is_dir if node is not None else False
 
 # ---------- File System Explorer Widget ----------
 class PdfExplorerWidget(QTreeView):
@@ -34,45 +371,31 @@ class PdfExplorerWidget(QTreeView):
         super().__init__(parent)
 
         self.setSelectionMode(QTreeView.SelectionMode.ExtendedSelection)
-        self.fs_model = QFileSystemModel()
-        self.fs_model.setReadOnly(False)
+        # Lazy dirs+PDFs model: filtering and dir-first sorting happen at
+        # scandir time, so there is no proxy and no per-row Python callback.
+        self.fs_model = PdfFsModel(parent=self)
+        self._deleteTasks = set()  # in-flight background deletes
+
+        self.setModel(self.fs_model)
+        self.setUniformRowHeights(True)
+        self.setHeaderHidden(True)  # single name column, no header needed
 
-        # EditKeyPressed: rename on F2, SelectedClicked: rename on second click
-        self.setEditTriggers(QAbstractItemView.EditTrigger.SelectedClicked)
+        self.setAlternatingRowColors(True)
 
-        # ---- Drag and drop ----
+        # ---- Drag and drop: move PDFs between folders ----
         self.setDragEnabled(True)
         self.setAcceptDrops(True)
-        self.viewport().setAcceptDrops(True) 
+        self.viewport().setAcceptDrops(True)
         self.setDropIndicatorShown(True)
         self.setDefaultDropAction(Qt.DropAction.MoveAction)
         self.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
 
-        self.proxy_model = PdfFilterProxyModel()
-        self.proxy_model.setSourceModel(self.fs_model)
-        self.proxy_model.setSortCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self.proxy_model.sort(0, Qt.SortOrder.AscendingOrder)
-
-        self.setModel(self.proxy_model)
-        self.setSortingEnabled(True)
-        self.setUniformRowHeights(True)
-        self.sortByColumn(0, Qt.SortOrder.AscendingOrder)
-
-        self.setColumnHidden(1, True)
-        self.setColumnHidden(2, True)
-        self.setColumnHidden(3, True)
-
-        self.setAlternatingRowColors(True)
-
+        # No plain :hover rule — it forces a full row repaint on every mouse
+        # move, which dominates painting on long listings.
         self.setStyleSheet("""
             QTreeView {
                 alternate-background-color: #E5E4E2;
                 outline: none; /* remove black border around items */
-            }                          
-
-            QTreeView::item:hover {
-                color: black;
-                background-color: #99C2FF;
             }
 
             QTreeView::item:selected {
@@ -86,70 +409,104 @@ class PdfExplorerWidget(QTreeView):
             }
         """)
 
-        # ---- Context menu ----
+        # ---- Context menu (built once; each popup only repoints the paths) ----
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.on_customContextMenuRequested)
 
+        self._contextPaths = []
+        self._menu = QMenu(self)
+        self._openAction = self._menu.addAction(
+            "Open in system viewer", lambda: self._openFile(self._contextPaths[0]))
+        self._revealAction = self._menu.addAction(
+            "Reveal in Explorer", lambda: self._revealInExplorer(self._contextPaths[0]))
+        self._renameAction = self._menu.addAction(
+            "Rename", lambda: self._renameFile(self._contextPaths[0]))
+
+        self._copyAction = QAction("Copy", self)
+        # Read the live selection on trigger — the shortcut is app-wide and
+        # must not replay whatever the last right-click happened to target.
+        self._copyAction.triggered.connect(
+            lambda: self._copyOnClipboard(self._selectedFilePaths()))
+        self._copyAction.setShortcut(QKeySequence.StandardKey.Copy)
+        self.addAction(self._copyAction)
+        self._menu.addAction(self._copyAction)
+
+        self._menu.addAction("Delete", lambda: self._deleteFile(self._contextPaths))
+
         # ---- Populate the view ----
         self.setRootPath(root_path)
 
+    def _selectedFilePaths(self):
+        selected_files = []
+        for index in self.selectionModel().selectedRows():
+            # node attribute read — no stat syscall per selected row
+            if self.fs_model.isDir(index): continue
+            selected_files.append(self.fs_model.filePath(index))
+        return selected_files
+
     def on_customContextMenuRequested(self, position: QPoint):
 
         proxy_index = self.indexAt(position)
         if not proxy_index.isValid(): return
 
-        selected_files = []
-        for proxy_index in self.selectionModel().selectedRows():
-            source_index = self.proxy_model.mapToSource(proxy_index)
-            path = self.fs_model.filePath(source_index)
-            if Path(path).is_dir(): continue
-            selected_files.append(path)
-
+        selected_files = self._selectedFilePaths()
         if selected_files == []: return
 
-        # ---- Create menu ----
-        menu = QMenu(self)
-
-        if len(selected_files) == 1:
-            menu.addAction("Open in system viewer", lambda: self._openFile(selected_files[0]))
-            menu.addAction("Reveal in Explorer", lambda: self._revealInExplorer(selected_files[0]))
-            menu.addAction("Rename", lambda: self._renameFile(selected_files[0]))
+        # ---- Show the prebuilt menu ----
+        self._contextPaths = selected_files
+        single = len(selected_files) == 1
+        for action in (self._openAction, self._revealAction, self._renameAction):
+            action.setVisible(single)
 
-        copy_action = QAction("Copy", self)
-        copy_action.triggered.connect(lambda: self._copyOnClipboard(selected_files))
-        copy_action.setShortcut(QKeySequence.StandardKey.Copy)
-        self.addAction(copy_action)
-        menu.addAction(copy_action)
-
-        menu.addAction("Delete", lambda: self._deleteFile(selected_files))
-        
-        menu.exec(self.viewport().mapToGlobal(position))
+        # popup() is non-blocking, unlike exec()
+        self._menu.popup(self.viewport().mapToGlobal(position))
 
     def _copyOnClipboard(self, file_paths):
         assert isinstance(file_paths, list), "file_paths should be a list"
+        if not file_paths:
+            return  # nothing selected; leave the clipboard alone
 
-        clipboard = QApplication.clipboard()
-        clipboard.clear()
         mime_data = QMimeData()
-        mime_data.setUrls([QUrl.fromLocalFile(file_path) for file_path in file_paths])
-        clipboard.setMimeData(mime_data)
+        # Serialize the uri-list ourselves: one setData call instead of
+        # setUrls converting a QVariant per URL.
+        uri_list = "\r\n".join(
+            QUrl.fromLocalFile(file_path).toString() for file_path in file_paths
+        ) + "\r\n"
+        mime_data.setData("text/uri-list", uri_list.encode("utf-8"))
+        # Plain-text fallback in the same payload, so e.g. pasting into an
+        # editor works without a second clipboard round trip
+        mime_data.setText("\n".join(file_paths))
+        QApplication.clipboard().setMimeData(mime_data)  # replaces old contents
 
     def _openFile(self, file_path):
         QDesktopServices.openUrl(QUrl.fromLocalFile(file_path))
 
     def _revealInExplorer(self, file_path):
-        subprocess.run(f'explorer.exe /select,{Path(file_path)}')
+        if _reveal_in_explorer_native(file_path):
+            return
+        # Non-blocking fallback; the old subprocess.run waited on the spawn
+        QProcess.startDetached('explorer.exe', [f'/select,{Path(file_path)}'])
 
     def _deleteFile(self, file_paths):
         assert isinstance(file_paths, list), "file_paths should be a list"
 
-        result = QMessageBox.warning(self, "Delete File", f"Are you sure you want to delete:\n{'\n'.join(file_paths)}", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        listing = "\n".join(file_paths)
+        result = QMessageBox.warning(self, "Delete File", f"Are you sure you want to delete:\n{listing}", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if result == QMessageBox.StandardButton.No: return
-        for file_path in file_paths:
-            try:
-                Path(file_path).unlink()
-            except PermissionError as e:
-                QMessageBox.warning(self, "Error", f"Could not delete file:\n{file_path}\n\n{str(e)}") 
+
+        # Unlink off-thread; each call can take hundreds of ms on slow volumes
+        task = _DeleteTask(file_paths)
+        task.signals.finished.connect(lambda d, e, t=task: self._onDeleteFinished(d, e, t))
+        self._deleteTasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def _onDeleteFinished(self, deleted, errors, task):
+        self._deleteTasks.discard(task)
+        for path in deleted:
+            self.fs_model.removePath(path)
+        if errors:
+            joined = "\n\n".join(errors)
+            QMessageBox.warning(self, "Error", f"Could not delete:\n{joined}")
 
     def _renameFile(self, file_path):
         old_path = Path(file_path)
@@ -173,15 +530,84 @@ class PdfExplorerWidget(QTreeView):
         if not Path(root_path).exists():
             raise FileNotFoundError(f"Root path not found: {root_path}")
         self.fs_model.setRootPath(root_path)
-        self.setRootIndex(self.proxy_model.mapFromSource(self.fs_model.index(root_path)))
+
+# ---------- Background delete ----------
+class _DeleteSignals(QObject):
+    finished = pyqtSignal(list, list)  # deleted paths, error strings
+
+class _DeleteTask(QRunnable):
+    """Unlink files on a pool thread; slow volumes must not freeze the UI."""
+
+    def __init__(self, paths):
+        super().__init__()
+        self.paths = paths
+        self.signals = _DeleteSignals()
+
+    def run(self):
+        deleted, errors = [], []
+        for path in self.paths:
+            try:
+                Path(path).unlink()
+                deleted.append(path)
+            except OSError as e:
+                errors.append(f"{path}\n{e}")
+        self.signals.finished.emit(deleted, errors)
+
+# ---------- Adjacent-file prefetch ----------
+class _PrefetchTask(QRunnable):
+    """Read the first MB of a file to warm the OS page cache."""
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.cancelled = False  # set from the GUI thread when superseded
+
+    def run(self):
+        if self.cancelled:
+            return
+        try:
+            with open(self.path, "rb") as f:
+                f.read(1 << 20)
+        except OSError:
+            pass
+
+# ---------- Background PDF loading ----------
+class _PdfLoadSignals(QObject):
+    loaded = pyqtSignal(QPdfDocument, str, int)
+
+class _PdfLoadTask(QRunnable):
+    """Parse a PDF into a fresh QPdfDocument off the GUI thread."""
+
+    def __init__(self, path, request_id):
+        super().__init__()
+        self.path = path
+        self.request_id = request_id
+        self.signals = _PdfLoadSignals()
+
+    def run(self):
+        doc = QPdfDocument()
+        doc.load(self.path)
+        app = QApplication.instance()
+        if app is not None:
+            doc.moveToThread(app.thread())
+        self.signals.loaded.emit(doc, self.path, self.request_id)
 
 # ---------- PDF Viewer -----------------
 class PdfView(QPdfView):
+    documentChanged = pyqtSignal(QPdfDocument)
+
+    _DOC_CACHE_SIZE = 4
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
-        self.pdfDoc = QPdfDocument(self)    
+        self.pdfDoc = QPdfDocument(self)
+        # Recently shown documents stay parsed; revisiting one is instant.
+        # dict preserves insertion order, so it doubles as a small LRU.
+        self._docCache = {}
+        self._loadRequestId = 0  # newest wins; stale loads only fill the cache
+        self._loadTasks = set()
 
         self.setDocument(self.pdfDoc)
         self.setPageMode(QPdfView.PageMode.MultiPage)
@@ -200,6 +626,51 @@ class PdfView(QPdfView):
         jumpEndAction.triggered.connect(lambda: self.pageNavigator().jump(self.pdfDoc.pageCount() - 1, QPointF(0, 0)))
         self.addAction(jumpEndAction)
 
+    def showDocument(self, path):
+        """Show `path`, reusing an already-parsed document when possible.
+
+        Cache misses parse on a worker thread; the current document stays
+        on screen (no blanking) until the new one is ready.
+        """
+        doc = self._docCache.pop(path, None)
+        if doc is not None:
+            self._docCache[path] = doc  # re-insert as most recently used
+            # Supersede any in-flight load, or its completion would yank
+            # the view away from what the user just selected.
+            self._loadRequestId += 1
+            self._setCurrentDocument(doc)
+            return
+
+        self._loadRequestId += 1
+        task = _PdfLoadTask(path, self._loadRequestId)
+        task.signals.loaded.connect(self._onDocumentLoaded)
+        self._loadTasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def _onDocumentLoaded(self, doc, path, request_id):
+        self._loadTasks = {t for t in self._loadTasks if t.request_id != request_id}
+        doc.setParent(self)
+        self._docCache[path] = doc
+        while len(self._docCache) > self._DOC_CACHE_SIZE:
+            oldest = next(iter(self._docCache))
+            evicted = self._docCache.pop(oldest)
+            if evicted is self.pdfDoc:
+                # Never close what's on screen: keep it cached as most
+                # recently used and evict the next-oldest instead.
+                self._docCache[oldest] = evicted
+                continue
+            evicted.close()
+            evicted.deleteLater()
+        if request_id == self._loadRequestId:
+            self._setCurrentDocument(doc)
+        # else: superseded — the parse still warms the cache
+
+    def _setCurrentDocument(self, doc):
+        if doc is not self.pdfDoc:
+            self.pdfDoc = doc
+            self.setDocument(doc)
+            self.documentChanged.emit(doc)
+
 # ---------- TOC Widget ----------
 class TocTree(QTreeView):
     def __init__(self, parent=None):
@@ -207,6 +678,7 @@ class TocTree(QTreeView):
 
         self.model = QPdfBookmarkModel(self)
         self.setHeaderHidden(True)
+        self.setUniformRowHeights(True)  # skip per-row geometry during expand
         self.setModel(self.model)
 
 # ---------- Main Window ----------
@@ -229,10 +701,22 @@ class MainWindow(QMainWindow):
         self.tocView.model.setDocument(self.pdfView.pdfDoc)
 
         # ---- favorites ----
-        self.favorites = QListWidget()
+        # QListView + QStringListModel: one allocation for the whole list,
+        # no QListWidgetItem per row; the set answers membership in O(1).
+        self.favorites = QListView()
+        self.favorites.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._favoritesModel = QStringListModel(self)
+        self.favorites.setModel(self._favoritesModel)
+        self._favoritesSet = set()
         self._loadFavorites()
 
+        # ---- sibling prefetch bookkeeping ----
+        self._prefetched = {}      # insertion-ordered LRU of warmed paths
+        self._prefetchTasks = []   # in-flight tasks, cancellable
+
         # ---- current page/toltal pages
+        self._pageCount = 0
+        self._pagesSuffix = ' / -'  # rebuilt once per document, not per flip
         self.pages = QLabel('- / -')
         self.pages.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.pages.setStyleSheet("font-weight: bold; font-size: 16pt;")
@@ -250,9 +734,10 @@ class MainWindow(QMainWindow):
 
         # ---- signals and slots ----
         self.pdfView.pdfDoc.statusChanged.connect(self.on_pdfView_statusChanged)
+        self.pdfView.documentChanged.connect(self.on_pdfView_documentChanged)
         self.pdfView.pageNavigator().currentPageChanged.connect(self.on_pdfView_currentPageChanged)
         self.fileView.activated.connect(self.on_fileView_activated)
-        self.favorites.itemActivated.connect(self.on_favorites_itemActivated)
+        self.favorites.activated.connect(self.on_favorites_activated)
         self.tocView.activated.connect(lambda index: self.pdfView.pageNavigator().jump(index.data(QPdfBookmarkModel.Role.Page), index.data(QPdfBookmarkModel.Role.Location)))
 
         # ---- overall layout of the window ----
@@ -273,35 +758,96 @@ class MainWindow(QMainWindow):
 
         self.setWindowState(Qt.WindowState.WindowMaximized)
 
-    def on_favorites_itemActivated(self, item):
+    def on_favorites_activated(self, index):
         # TODO: add error handling
         # TODO: connect signal to self.fileView.setRootPath directly?
-        folder = item.text()
+        folder = index.data()
         self.fileView.setRootPath(folder)
 
-    def on_fileView_activated(self, proxy_index):
-        proxy_model = proxy_index.model()
-        source_model = proxy_model.sourceModel()
-        source_index = proxy_model.mapToSource(proxy_index)
-        currentFile = Path(source_model.filePath(source_index))
-        if currentFile.is_dir(): return
+    def on_fileView_activated(self, index):
+        # The view's model is always fs_model; no index.model() round trip
+        model = self.fileView.fs_model
+        if model.isDir(index): return  # attribute read, no stat syscall
+        currentFile = Path(model.filePath(index))
 
         self.setWindowTitle(f"{APP_NAME} - {Path(currentFile).name}")
-        self.pdfView.pdfDoc.load(str(currentFile))
-
-        self.tocView.expandAll()
+        self.pdfView.showDocument(str(currentFile))
+
+        # Users tend to open neighbours next; warm their first MB in the
+        # background so the next click costs render time only.
+        self._prefetchSiblings(index)
+
+    def _prefetchSiblings(self, index):
+        node = index.internalPointer()
+        if node is None or node.parent is None or node.parent.children is None:
+            return
+        siblings = node.parent.children
+        candidates = []
+        for step in (-1, 1):  # nearest PDF on either side
+            i = node.row + step
+            while 0 <= i < len(siblings):
+                if not siblings[i].is_dir:
+                    candidates.append(siblings[i].path)
+                    break
+                i += step
+
+        for task in self._prefetchTasks:
+            task.cancelled = True  # navigated away; don't waste the I/O
+        self._prefetchTasks = []
+        for path in candidates:
+            if path in self._prefetched:
+                continue
+            self._prefetched[path] = None
+            while len(self._prefetched) > 16:
+                self._prefetched.pop(next(iter(self._prefetched)))
+            task = _PrefetchTask(path)
+            self._prefetchTasks.append(task)
+            QThreadPool.globalInstance().start(task)
+
+    def _expandToc(self):
+        self.tocView.setUpdatesEnabled(False)
+        try:
+            self.tocView.expandRecursively(QModelIndex(), -1)
+        finally:
+            self.tocView.setUpdatesEnabled(True)
+
+    def on_pdfView_documentChanged(self, doc):
+        """The view swapped to a (possibly cached) document; follow it."""
+        self.tocView.model.setDocument(doc)
+        # Cached documents keep their connection from the first visit, and
+        # PyQt6 raises TypeError (not a silent no-op) for a duplicate
+        # UniqueConnection — so tolerate the already-connected case instead.
+        try:
+            doc.statusChanged.connect(
+                self.on_pdfView_statusChanged, Qt.ConnectionType.UniqueConnection
+            )
+        except TypeError:
+            pass  # already connected
+        if doc.status() == QPdfDocument.Status.Ready:
+            # Cache hit: statusChanged won't fire again, refresh directly
+            self.on_pdfView_statusChanged(QPdfDocument.Status.Ready)
 
     def on_pdfView_statusChanged(self, status):
         if status == QPdfDocument.Status.Ready:
-            self.pages.setText(f'{self.pdfView.pageNavigator().currentPage() + 1} / {self.pdfView.pdfDoc.pageCount()}')
+            self._pageCount = self.pdfView.pdfDoc.pageCount()
+            self._pagesSuffix = f' / {self._pageCount}'
+            self.pages.setText(f'{self.pdfView.pageNavigator().currentPage() + 1}{self._pagesSuffix}')
+            # Expand once the bookmark model is bound to the ready document
+            # (loads finish on a worker, so activation time is too early);
+            # deep TOCs otherwise cost one redraw per row.
+            QTimer.singleShot(0, self._expandToc)
 
     def on_pdfView_currentPageChanged(self, page):
-        self.pages.setText(f'{page + 1} / {self.pdfView.pdfDoc.pageCount()}')
+        # No pageCount() FFI call per scroll tick; the suffix is prebuilt
+        self.pages.setText(f'{page + 1}{self._pagesSuffix}')
 
     def _loadFavorites(self):
-        rows = Path('favorites.txt').read_text(encoding='utf-8').splitlines()
-        for row in rows:
-            self.favorites.addItem(row)
+        # read_bytes skips text-mode newline translation; one decode pass
+        rows = Path('favorites.txt').read_bytes().decode('utf-8').splitlines()
+        rows = [row for row in rows if row.strip()]
+        rows = list(dict.fromkeys(rows))  # dedupe, keeping file order
+        self._favoritesModel.setStringList(rows)  # single bulk insert
+        self._favoritesSet = set(rows)
         
 # ---------- main ----------
 def main():